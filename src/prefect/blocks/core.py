@@ -1,9 +1,12 @@
+import builtins
 import hashlib
 import html
 import inspect
 import sys
 import warnings
 from abc import ABC
+from functools import partial
+from itertools import chain
 from textwrap import dedent
 from typing import (
     TYPE_CHECKING,
@@ -18,6 +21,7 @@ from typing import (
 )
 from uuid import UUID, uuid4
 
+import anyio
 from griffe.dataclasses import Docstring
 from griffe.docstrings.dataclasses import DocstringSection, DocstringSectionKind
 from griffe.docstrings.parsers import Parser, parse
@@ -43,7 +47,7 @@ from prefect.server.schemas.core import (
     BlockSchema,
     BlockType,
 )
-from prefect.utilities.asyncutils import sync_compatible
+from prefect.utilities.asyncutils import gather, sync_compatible
 from prefect.utilities.collections import listrepr, remove_nested_keys
 from prefect.utilities.dispatch import lookup_type, register_base_type
 from prefect.utilities.hashing import hash_objects
@@ -76,14 +80,17 @@ def _collect_nested_reference_strings(obj: Dict):
     Collects all nested reference strings (e.g. #/definitions/Model) from a given object.
     """
     found_reference_strings = []
-    if isinstance(obj, dict):
-        if obj.get("$ref"):
-            found_reference_strings.append(obj.get("$ref"))
-        for value in obj.values():
-            found_reference_strings.extend(_collect_nested_reference_strings(value))
-    if isinstance(obj, list):
-        for item in obj:
-            found_reference_strings.extend(_collect_nested_reference_strings(item))
+    # Walk the object iteratively in depth-first order; children are pushed in
+    # reverse so they are visited in their original order
+    stack = [obj]
+    while stack:
+        current = stack.pop()
+        if isinstance(current, dict):
+            if current.get("$ref"):
+                found_reference_strings.append(current.get("$ref"))
+            stack.extend(reversed(list(current.values())))
+        elif isinstance(current, list):
+            stack.extend(reversed(current))
     return found_reference_strings
 
 
@@ -141,6 +148,86 @@ def _collect_secret_fields(name: str, type_: Type, secrets: List[str]) -> None:
         secrets.extend(f"{name}.{s}" for s in type_.schema()["secret_fields"])
 
 
+def _get_nested_block_types(block_cls: Type["Block"]) -> List[Type["Block"]]:
+    """
+    Returns the block classes directly referenced by the fields of a block class,
+    including members of `Union` fields.
+    """
+    nested_block_types = []
+    for field in block_cls.__fields__.values():
+        if get_origin(field.type_) is Union:
+            candidates = get_args(field.type_)
+        else:
+            candidates = (field.type_,)
+        for type_ in candidates:
+            if Block.is_block_class(type_) and type_ not in nested_block_types:
+                nested_block_types.append(type_)
+    return nested_block_types
+
+
+def _get_nested_block_levels(block_cls: Type["Block"]) -> List[List[Type["Block"]]]:
+    """
+    Groups all block classes nested within a block class by their maximum depth
+    of nesting. Levels are returned deepest first, so every block comes after
+    all the blocks it references. The given block class itself is not included.
+    """
+    depths: Dict[Type["Block"], int] = {}
+
+    def visit(cls: Type["Block"], depth: int):
+        for nested_block_type in _get_nested_block_types(cls):
+            if depths.get(nested_block_type, 0) < depth:
+                depths[nested_block_type] = depth
+                visit(nested_block_type, depth + 1)
+
+    visit(block_cls, 1)
+
+    levels: Dict[int, List[Type["Block"]]] = {}
+    for cls, depth in depths.items():
+        levels.setdefault(depth, []).append(cls)
+    return [levels[depth] for depth in sorted(levels, reverse=True)]
+
+
+async def _register_blocks_in_order(
+    block_classes: List[Type["Block"]], client: "PrefectClient"
+):
+    """
+    Registers the block type and schema of each given block class, one after
+    another, without registering nested blocks.
+    """
+    for block_cls in block_classes:
+        await block_cls._register_type_and_schema(client=client)
+
+
+# Exception groups raised by task groups: `anyio.ExceptionGroup` on anyio 3 and the
+# builtin `BaseExceptionGroup` (or its backport) on anyio 4
+try:
+    from exceptiongroup import BaseExceptionGroup as _BackportExceptionGroup
+except ImportError:
+    _BackportExceptionGroup = None
+
+_EXCEPTION_GROUP_TYPES = tuple(
+    group_type
+    for group_type in (
+        getattr(anyio, "ExceptionGroup", None),
+        getattr(builtins, "BaseExceptionGroup", None),
+        _BackportExceptionGroup,
+    )
+    if group_type is not None
+)
+
+
+def _unwrap_exception_group(exc: BaseException) -> BaseException:
+    """
+    Returns the first exception contained in a (possibly nested) exception group,
+    or the given exception if it is not an exception group.
+
+    Only the first error is returned; any other errors in the group are dropped.
+    """
+    while isinstance(exc, _EXCEPTION_GROUP_TYPES) and exc.exceptions:
+        exc = exc.exceptions[0]
+    return exc
+
+
 def _should_update_block_type(
     local_block_type: BlockType, server_block_type: BlockType
 ) -> bool:
@@ -288,6 +375,11 @@ class Block(BaseModel, ABC):
     _block_document_name: Optional[str] = None
     _is_anonymous: Optional[bool] = None
 
+    # -- private cached class variables
+    # computed lazily and stored on each class
+    _schema_checksum: Optional[str] = None
+    _block_capabilities: Optional[FrozenSet[str]] = None
+
     # Exclude `save` as it uses the `sync_compatible` decorator and needs to be
     # decorated directly.
     _events_excluded_methods = ["block_initialization", "save", "dict"]
@@ -296,7 +388,9 @@ class Block(BaseModel, ABC):
     def __dispatch_key__(cls):
         if cls.__name__ == "Block":
             return None  # The base class is abstract
-        return block_schema_to_key(cls._to_block_schema())
+        # Equivalent to `block_schema_to_key(cls._to_block_schema())` without
+        # building the full block schema and block type
+        return cls.get_block_type_slug()
 
     @classmethod
     def get_block_type_name(cls):
@@ -312,13 +406,17 @@ class Block(BaseModel, ABC):
         Returns the block capabilities for this Block. Recursively collects all block
         capabilities of all parent classes into a single frozenset.
         """
-        return frozenset(
-            {
-                c
-                for base in (cls,) + cls.__mro__
-                for c in getattr(base, "_block_schema_capabilities", []) or []
-            }
-        )
+        capabilities = cls.__dict__.get("_block_capabilities")
+        if capabilities is None:
+            capabilities = frozenset(
+                {
+                    c
+                    for base in cls.__mro__
+                    for c in getattr(base, "_block_schema_capabilities", []) or []
+                }
+            )
+            cls._block_capabilities = capabilities
+        return capabilities
 
     @classmethod
     def _get_current_package_version(cls):
@@ -362,9 +460,15 @@ class Block(BaseModel, ABC):
         Returns:
             str: The calculated checksum prefixed with the hashing algorithm used.
         """
-        block_schema_fields = (
-            cls.schema() if block_schema_fields is None else block_schema_fields
-        )
+        if block_schema_fields is None:
+            # The checksum of a class's own schema is cached on the class itself.
+            # `cls.__dict__` is used so subclasses do not inherit a parent's value.
+            checksum = cls.__dict__.get("_schema_checksum")
+            if checksum is None:
+                checksum = cls._calculate_schema_checksum(cls.schema())
+                cls._schema_checksum = checksum
+            return checksum
+
         fields_for_checksum = remove_nested_keys(["secret_fields"], block_schema_fields)
         if fields_for_checksum.get("definitions"):
             non_block_definitions = _get_non_block_reference_definitions(
@@ -842,20 +946,55 @@ class Block(BaseModel, ABC):
                 "`register_type_and_schema` should be called on a Block "
                 "subclass and not on the Block class directly."
             )
-        if ABC in getattr(cls, "__bases__", []):
-            raise InvalidBlockRegistration(
-                "`register_type_and_schema` should be called on a Block "
-                "subclass and not on a Block interface class directly."
-            )
+        nested_block_levels = _get_nested_block_levels(cls)
+
+        # Check all blocks before registering any of them so an invalid nested
+        # block fails the registration up front
+        for block_cls in (cls, *chain.from_iterable(nested_block_levels)):
+            if ABC in getattr(block_cls, "__bases__", []):
+                raise InvalidBlockRegistration(
+                    "`register_type_and_schema` should be called on a Block "
+                    "subclass and not on a Block interface class directly."
+                )
+
+        # Nested blocks are registered level by level, starting with the most deeply
+        # nested. Blocks within a level do not reference each other, so they can be
+        # registered concurrently. A block is only registered once even if it is
+        # referenced from several places.
+        for level in nested_block_levels:
+            # Reading and creating a block type is not atomic, so blocks that share
+            # a block type slug are registered one after another
+            blocks_by_slug: Dict[str, List[Type[Block]]] = {}
+            for nested_block in level:
+                blocks_by_slug.setdefault(
+                    nested_block.get_block_type_slug(), []
+                ).append(nested_block)
+
+            error = None
+            try:
+                await gather(
+                    *(
+                        partial(_register_blocks_in_order, blocks, client=client)
+                        for blocks in blocks_by_slug.values()
+                    )
+                )
+            except _EXCEPTION_GROUP_TYPES as exc:
+                # Report the first original error rather than the exception group
+                # used by the task group to report concurrent failures
+                error = _unwrap_exception_group(exc)
+            # Raised outside of the `except` block so the error keeps its own
+            # context instead of being chained to the exception group
+            if error is not None:
+                raise error
 
-        for field in cls.__fields__.values():
-            if Block.is_block_class(field.type_):
-                await field.type_.register_type_and_schema(client=client)
-            if get_origin(field.type_) is Union:
-                for type_ in get_args(field.type_):
-                    if Block.is_block_class(type_):
-                        await type_.register_type_and_schema(client=client)
+        await cls._register_type_and_schema(client=client)
 
+    @classmethod
+    async def _register_type_and_schema(cls, client: "PrefectClient"):
+        """
+        Registers the block type and schema of this block, without registering
+        nested blocks.
+        """
         try:
             block_type = await client.read_block_type_by_slug(
                 slug=cls.get_block_type_slug()
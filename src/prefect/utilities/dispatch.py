@@ -35,13 +35,11 @@ def get_registry_for_type(cls: T) -> Optional[Dict[str, T]]:
 
     If not found, `None` is returned.
     """
-    return next(
-        filter(
-            lambda registry: registry is not None,
-            (_TYPE_REGISTRIES.get(cls) for cls in cls.mro()),
-        ),
-        None,
-    )
+    for base in cls.__mro__:
+        registry = _TYPE_REGISTRIES.get(base)
+        if registry is not None:
+            return registry
+    return None
 
 
 def get_dispatch_key(
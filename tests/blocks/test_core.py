@@ -5,6 +5,7 @@ from textwrap import dedent
 from typing import Dict, Type, Union
 from uuid import UUID, uuid4
 
+import anyio
 import pytest
 from packaging.version import Version
 from pydantic import BaseModel, Field, SecretBytes, SecretStr, ValidationError
@@ -15,6 +16,7 @@ from prefect.blocks.fields import SecretDict
 from prefect.blocks.system import JSON, Secret
 from prefect.client import PrefectClient
 from prefect.exceptions import PrefectHTTPStatusError
+from prefect.filesystems import ReadableFileSystem, WritableFileSystem
 from prefect.server import models
 from prefect.server.schemas.actions import BlockDocumentCreate
 from prefect.server.schemas.core import DEFAULT_BLOCK_SCHEMA_VERSION
@@ -521,6 +523,23 @@ class TestAPICompatibility:
             "secret_fields": [],
         }
 
+    def test_schema_checksum_is_cached_per_class(self):
+        class Parent(Block):
+            x: str
+
+        class Child(Parent):
+            y: int
+
+        checksum = Parent._calculate_schema_checksum()
+        assert Parent._calculate_schema_checksum() is checksum
+        assert Parent._calculate_schema_checksum(Parent.schema()) == checksum
+
+        # Subclasses do not inherit the cached checksum of their parent
+        assert Child._calculate_schema_checksum() != checksum
+        assert Child._calculate_schema_checksum(Child.schema()) == (
+            Child._calculate_schema_checksum()
+        )
+
     def test_create_api_block_with_arguments(self, block_type_x):
         with pytest.raises(ValueError, match="(No name provided)"):
             self.MyRegisteredBlock(x="x")._to_block_document()
@@ -802,11 +821,14 @@ class TestAPICompatibility:
         class FlyingCat(Cat, Bird):
             pass
 
-        assert Duck.get_block_capabilities() == {"swim", "fly"}
-        assert Bird.get_block_capabilities() == {"fly"}
-        assert Cat.get_block_capabilities() == {"run"}
-        assert Crow.get_block_capabilities() == {"fly", "run"}
-        assert FlyingCat.get_block_capabilities() == {"fly", "run"}
+        assert Duck.get_block_capabilities() == frozenset({"swim", "fly"})
+        assert Bird.get_block_capabilities() == frozenset({"fly"})
+        assert Cat.get_block_capabilities() == frozenset({"run"})
+        assert Crow.get_block_capabilities() == frozenset({"fly", "run"})
+        assert FlyingCat.get_block_capabilities() == frozenset({"fly", "run"})
+
+        # Capabilities are collected once per class
+        assert Duck.get_block_capabilities() is Duck.get_block_capabilities()
 
     def test_create_block_schema_from_nested_blocks(self):
         block_schema_id = uuid4()
@@ -1080,13 +1102,14 @@ class TestRegisterBlockTypeAndSchema:
         self, orion_client: PrefectClient
     ):
         # Ignore warning caused by matching key in registry
-        warnings.filterwarnings("ignore", category=UserWarning)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
 
-        class ImpostorBlock(Block):
-            _block_type_name = "NewBlock"
-            x: str
-            y: str
-            z: int
+            class ImpostorBlock(Block):
+                _block_type_name = "NewBlock"
+                x: str
+                y: str
+                z: int
 
         await ImpostorBlock.register_type_and_schema()
 
@@ -1105,9 +1128,6 @@ class TestRegisterBlockTypeAndSchema:
     async def test_register_new_block_schema_when_version_changes(
         self, orion_client: PrefectClient
     ):
-        # Ignore warning caused by matching key in registry
-        warnings.filterwarnings("ignore", category=UserWarning)
-
         await self.NewBlock.register_type_and_schema()
 
         block_schema = await orion_client.read_block_schema_by_checksum(
@@ -1210,6 +1230,114 @@ class TestRegisterBlockTypeAndSchema:
         )
         assert umbrella_block_schema is not None
 
+    async def test_register_nested_block_referenced_more_than_once(
+        self, orion_client: PrefectClient, monkeypatch
+    ):
+        class Leaf(Block):
+            value: str
+
+        class Branch(Block):
+            leaf: Leaf
+
+        class Tree(Block):
+            leaf: Leaf
+            left: Branch
+            right: Branch
+
+        registered = []
+        register_type_and_schema = Block._register_type_and_schema.__func__
+
+        async def record_registration(cls, client):
+            registered.append(cls)
+            return await register_type_and_schema(cls, client=client)
+
+        monkeypatch.setattr(
+            Block, "_register_type_and_schema", classmethod(record_registration)
+        )
+
+        await Tree.register_type_and_schema()
+
+        # Each block is registered once, after all of the blocks it references
+        assert registered == [Leaf, Branch, Tree]
+
+        for block_cls in (Leaf, Branch, Tree):
+            block_type = await orion_client.read_block_type_by_slug(
+                slug=block_cls.get_block_type_slug()
+            )
+            assert block_type.id == block_cls._block_type_id
+            block_schema = await orion_client.read_block_schema_by_checksum(
+                checksum=block_cls._calculate_schema_checksum()
+            )
+            assert block_schema.id == block_cls._block_schema_id
+
+    async def test_register_nested_blocks_sharing_block_type_slug(
+        self, orion_client: PrefectClient
+    ):
+        class V1(Block):
+            _block_type_slug = "shared-slug"
+            x: str
+
+        with pytest.warns(UserWarning, match="matches existing registered type 'V1'"):
+
+            class V2(Block):
+                _block_type_slug = "shared-slug"
+                x: str
+                y: int
+
+        class Holder(Block):
+            old: V1
+            new: V2
+
+        await Holder.register_type_and_schema()
+
+        block_type = await orion_client.read_block_type_by_slug(slug="shared-slug")
+        assert V1._block_type_id == V2._block_type_id == block_type.id
+        for block_cls in (V1, V2):
+            block_schema = await orion_client.read_block_schema_by_checksum(
+                checksum=block_cls._calculate_schema_checksum()
+            )
+            assert block_schema.block_type_id == block_type.id
+
+    async def test_register_nested_blocks_raises_original_error(self, monkeypatch):
+        class Left(Block):
+            value: str
+
+        class Right(Block):
+            value: str
+
+        class Parent(Block):
+            left: Left
+            right: Right
+
+        async def fail_registration(cls, client):
+            try:
+                raise KeyError(cls.__name__)
+            except KeyError:
+                # Shielded so both registrations fail instead of one being cancelled
+                with anyio.CancelScope(shield=True):
+                    await anyio.sleep(0)
+                raise ValueError(f"Failed to register {cls.__name__}")
+
+        monkeypatch.setattr(
+            Block, "_register_type_and_schema", classmethod(fail_registration)
+        )
+
+        with pytest.raises(ValueError, match="Failed to register") as exc_info:
+            await Parent.register_type_and_schema()
+
+        # The error keeps its own context rather than the exception group
+        assert isinstance(exc_info.value.__context__, KeyError)
+
+    async def test_register_nested_union_of_interfaces_raises(self):
+        class UsesFileSystem(Block):
+            fs: Union[ReadableFileSystem, WritableFileSystem]
+
+        with pytest.raises(
+            InvalidBlockRegistration,
+            match="not on a Block interface class directly",
+        ):
+            await UsesFileSystem.register_type_and_schema()
+
     async def test_register_raises_block_base_class(self):
         with pytest.raises(
             InvalidBlockRegistration,
@@ -1222,17 +1350,18 @@ class TestRegisterBlockTypeAndSchema:
 
     async def test_register_updates_block_type(self, orion_client: PrefectClient):
         # Ignore warning caused by matching key in registry
-        warnings.filterwarnings("ignore", category=UserWarning)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
 
-        class Before(Block):
-            _block_type_name = "Test Block"
-            _description = "Before"
-            message: str
+            class Before(Block):
+                _block_type_name = "Test Block"
+                _description = "Before"
+                message: str
 
-        class After(Block):
-            _block_type_name = "Test Block"
-            _description = "After"
-            message: str
+            class After(Block):
+                _block_type_name = "Test Block"
+                _description = "After"
+                message: str
 
         await Before.register_type_and_schema()
 
@@ -1248,17 +1377,18 @@ class TestRegisterBlockTypeAndSchema:
         self, orion_client: PrefectClient
     ):
         # Ignore warning caused by matching key in registry
-        warnings.filterwarnings("ignore", category=UserWarning)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
 
-        class Before(Block):
-            _block_type_name = "Test Block"
-            _description = "Before"
-            message: str
+            class Before(Block):
+                _block_type_name = "Test Block"
+                _description = "Before"
+                message: str
 
-        class After(Block):
-            _block_type_name = "Test Block"
-            _description = "After"
-            message: str
+            class After(Block):
+                _block_type_name = "Test Block"
+                _description = "After"
+                message: str
 
         await Before.register_type_and_schema()
 
@@ -1305,11 +1435,12 @@ class TestSaveBlock:
     @pytest.fixture
     def NewBlock(self):
         # Ignore warning caused by matching key in registry due to block fixture
-        warnings.filterwarnings("ignore", category=UserWarning)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=UserWarning)
 
-        class NewBlock(Block):
-            a: str
-            b: str
+            class NewBlock(Block):
+                a: str
+                b: str
 
         return NewBlock
 
@@ -1328,6 +1459,12 @@ class TestSaveBlock:
 
         return OuterBlock
 
+    @pytest.fixture
+    async def saved_inner_block(self, InnerBlock):
+        inner_block = InnerBlock(size=1)
+        await inner_block.save("my-inner-block")
+        return inner_block
+
     async def test_save_block(self, NewBlock):
         new_block = NewBlock(a="foo", b="bar")
         new_block_name = "my-block"
@@ -1624,10 +1761,8 @@ class TestSaveBlock:
         assert api_block.child.b == "b"
         assert api_block.child.c.get_secret_value() == {"secret": "value"}
 
-    async def test_save_block_with_overwrite(self, InnerBlock):
-        inner_block = InnerBlock(size=1)
-        await inner_block.save("my-inner-block")
-
+    async def test_save_block_with_overwrite(self, InnerBlock, saved_inner_block):
+        inner_block = saved_inner_block
         inner_block.size = 2
         await inner_block.save("my-inner-block", overwrite=True)
 
@@ -1635,10 +1770,10 @@ class TestSaveBlock:
         loaded_inner_block.size = 2
         assert loaded_inner_block == inner_block
 
-    async def test_save_block_without_overwrite_raises(self, InnerBlock):
-        inner_block = InnerBlock(size=1)
-        await inner_block.save("my-inner-block")
-
+    async def test_save_block_without_overwrite_raises(
+        self, InnerBlock, saved_inner_block
+    ):
+        inner_block = saved_inner_block
         inner_block.size = 2
 
         with pytest.raises(
@@ -1653,10 +1788,7 @@ class TestSaveBlock:
         loaded_inner_block = await InnerBlock.load("my-inner-block")
         loaded_inner_block.size = 1
 
-    async def test_update_from_loaded_block(self, InnerBlock):
-        inner_block = InnerBlock(size=1)
-        await inner_block.save("my-inner-block")
-
+    async def test_update_from_loaded_block(self, InnerBlock, saved_inner_block):
         loaded_inner_block = await InnerBlock.load("my-inner-block")
         loaded_inner_block.size = 2
         await loaded_inner_block.save("my-inner-block", overwrite=True)
@@ -1664,10 +1796,7 @@ class TestSaveBlock:
         loaded_inner_block_after_update = await InnerBlock.load("my-inner-block")
         assert loaded_inner_block == loaded_inner_block_after_update
 
-    async def test_update_from_in_memory_block(self, InnerBlock):
-        inner_block = InnerBlock(size=1)
-        await inner_block.save("my-inner-block")
-
+    async def test_update_from_in_memory_block(self, InnerBlock, saved_inner_block):
         updated_inner_block = InnerBlock(size=2)
         await updated_inner_block.save("my-inner-block", overwrite=True)
 
@@ -1,8 +1,6 @@
 import os
 import shutil
 import sys
-from pathlib import Path
-from tempfile import TemporaryDirectory
 
 import pytest
 import yaml
@@ -47,22 +45,20 @@ class TestProjectRecipes:
 
 
 class TestProjectInit:
-    def test_project_init(self):
-        with TemporaryDirectory() as tempdir:
-            result = invoke_and_assert(
-                "project init --name test_project", temp_dir=str(tempdir)
-            )
-            assert result.exit_code == 0
-            for file in ["prefect.yaml", "deployment.yaml", ".prefectignore"]:
-                # temp_dir creates a *new* nested temporary directory within tempdir
-                assert any(Path(tempdir).rglob(file))
-
-    def test_project_init_with_recipe(self):
-        with TemporaryDirectory() as tempdir:
-            result = invoke_and_assert(
-                "project init --name test_project --recipe local", temp_dir=str(tempdir)
-            )
-            assert result.exit_code == 0
+    def test_project_init(self, tmp_path):
+        result = invoke_and_assert(
+            "project init --name test_project", temp_dir=str(tmp_path)
+        )
+        assert result.exit_code == 0
+        for file in ["prefect.yaml", "deployment.yaml", ".prefectignore"]:
+            # temp_dir creates a *new* nested temporary directory within tmp_path
+            assert any(tmp_path.rglob(file))
+
+    def test_project_init_with_recipe(self, tmp_path):
+        result = invoke_and_assert(
+            "project init --name test_project --recipe local", temp_dir=str(tmp_path)
+        )
+        assert result.exit_code == 0
 
     def test_project_init_with_unknown_recipe(self):
         result = invoke_and_assert(
@@ -16,37 +16,47 @@ from prefect.projects.base import (
 )
 
 TEST_PROJECTS_DIR = prefect.__root_path__ / "tests" / "test-projects"
+RECIPES_DIR = prefect.__root_path__ / "src" / "prefect" / "projects" / "recipes"
 
+with os.scandir(RECIPES_DIR) as entries:
+    RECIPES = sorted(entry.name for entry in entries if entry.is_dir())
 
-@pytest.fixture(autouse=True)
-def project_dir(tmp_path):
-    original_dir = os.getcwd()
+
+def read_prefect_yaml() -> dict:
+    return yaml.safe_load(Path("prefect.yaml").read_text())
+
+
+@pytest.fixture
+def project_dir(tmp_path, monkeypatch):
     if sys.version_info >= (3, 8):
         shutil.copytree(TEST_PROJECTS_DIR, tmp_path, dirs_exist_ok=True)
         (tmp_path / ".prefect").mkdir(exist_ok=True)
-        os.chdir(tmp_path)
-        yield tmp_path
+        monkeypatch.chdir(tmp_path)
+        return tmp_path
     else:
         shutil.copytree(TEST_PROJECTS_DIR, tmp_path / "three-seven")
         (tmp_path / "three-seven" / ".prefect").mkdir(exist_ok=True)
-        os.chdir(tmp_path / "three-seven")
-        yield tmp_path / "three-seven"
-    os.chdir(original_dir)
+        monkeypatch.chdir(tmp_path / "three-seven")
+        return tmp_path / "three-seven"
 
 
 class TestFindProject:
-    async def test_find_project_works_in_root(self, tmp_path):
-        # make hidden .prefect/ directory in tmp_path
-        (tmp_path / ".prefect").mkdir(exist_ok=True)
-        assert find_prefect_directory(tmp_path) == tmp_path / ".prefect"
-
-    async def test_find_project_works_in_subdir(self, tmp_path):
-        # make hidden .prefect/ directory in tmp_path
-        (tmp_path / ".prefect").mkdir(exist_ok=True)
-        (tmp_path / "subdir" / "subsubdir").mkdir(parents=True)
+    @pytest.fixture(scope="class")
+    def project_root(self, tmp_path_factory):
+        # these tests only read the directory tree, so it can be shared
+        root = tmp_path_factory.mktemp("project-root")
+        # make hidden .prefect/ directory in the project root
+        (root / ".prefect").mkdir()
+        (root / "subdir" / "subsubdir").mkdir(parents=True)
+        return root
+
+    async def test_find_project_works_in_root(self, project_root):
+        assert find_prefect_directory(project_root) == project_root / ".prefect"
+
+    async def test_find_project_works_in_subdir(self, project_root):
         assert (
-            find_prefect_directory(tmp_path / "subdir" / "subsubdir")
-            == tmp_path / ".prefect"
+            find_prefect_directory(project_root / "subdir" / "subsubdir")
+            == project_root / ".prefect"
         )
 
 
@@ -55,31 +65,13 @@ class TestRecipes:
         with pytest.raises(ValueError, match="Unknown recipe"):
             configure_project_by_recipe("not-a-recipe")
 
-    @pytest.mark.parametrize(
-        "recipe",
-        [
-            d.absolute().name
-            for d in Path(
-                prefect.__root_path__ / "src" / "prefect" / "projects" / "recipes"
-            ).iterdir()
-            if d.is_dir()
-        ],
-    )
+    @pytest.mark.parametrize("recipe", RECIPES)
     async def test_configure_project_by_recipe_doesnt_raise(self, recipe):
         recipe_config = configure_project_by_recipe(recipe)
         for key in ["name", "prefect-version", "build", "push", "pull"]:
             assert key in recipe_config
 
-    @pytest.mark.parametrize(
-        "recipe",
-        [
-            d.absolute().name
-            for d in Path(
-                prefect.__root_path__ / "src" / "prefect" / "projects" / "recipes"
-            ).iterdir()
-            if d.is_dir() and "git" in d.absolute().name
-        ],
-    )
+    @pytest.mark.parametrize("recipe", [r for r in RECIPES if "git" in r])
     async def test_configure_project_handles_templates_on_git_recipes(self, recipe):
         recipe_config = configure_project_by_recipe(
             recipe, repository="test-org/test-repo"
@@ -98,6 +90,7 @@ class TestRecipes:
         assert clone_step["directory"] == "/opt/prefect/test-dir"
 
 
+@pytest.mark.usefixtures("project_dir")
 class TestInitProject:
     async def test_initialize_project_works(self):
         files = initialize_project()
@@ -107,8 +100,7 @@ class TestInitProject:
             assert Path(file).exists()
 
         # test defaults
-        with open("prefect.yaml", "r") as f:
-            contents = yaml.safe_load(f)
+        contents = read_prefect_yaml()
 
         assert contents["name"] is not None
         assert contents["prefect-version"] == prefect.__version__
@@ -117,8 +109,7 @@ class TestInitProject:
         files = initialize_project(name="my-test-its-a-test")
         assert len(files) >= 3
 
-        with open("prefect.yaml", "r") as f:
-            contents = yaml.safe_load(f)
+        contents = read_prefect_yaml()
 
         assert contents["name"] == "my-test-its-a-test"
 
@@ -126,8 +117,7 @@ class TestInitProject:
         files = initialize_project(recipe="docker-git")
         assert len(files) >= 3
 
-        with open("prefect.yaml", "r") as f:
-            contents = yaml.safe_load(f)
+        contents = read_prefect_yaml()
 
         clone_step = contents["pull"][0]
         assert "prefect.projects.steps.git_clone_project" in clone_step
@@ -137,43 +127,35 @@ class TestInitProject:
 
 
 class TestRegisterFlow:
-    async def test_register_flow_works_in_root(self, project_dir):
-        f = await register_flow(
-            str(project_dir / "import-project" / "my_module" / "flow.py") + ":test_flow"
-        )
-        assert f.name == "test"
+    @pytest.fixture
+    def flow_path(self, project_dir):
+        return os.fspath(project_dir / "import-project" / "my_module" / "flow.py")
 
-        with open(project_dir / ".prefect" / "flows.json", "r") as f:
-            flows = json.load(f)
+    @pytest.fixture
+    async def registered_test_flow(self, flow_path):
+        return await register_flow(f"{flow_path}:test_flow")
 
-        assert flows["test"] == "import-project/my_module/flow.py:test_flow"
+    async def test_register_flow_works_in_root(self, project_dir, registered_test_flow):
+        assert registered_test_flow.name == "test"
 
-    async def test_register_flow_allows_identical_calls(self, project_dir):
-        f = await register_flow(
-            str(project_dir / "import-project" / "my_module" / "flow.py") + ":test_flow"
-        )
-        assert f.name == "test"
+        flows = json.loads((project_dir / ".prefect" / "flows.json").read_bytes())
 
-        f = await register_flow(
-            str(project_dir / "import-project" / "my_module" / "flow.py") + ":test_flow"
-        )
-        assert f.name == "test"
+        assert flows["test"] == "import-project/my_module/flow.py:test_flow"
 
-    async def test_register_flow_disallows_overwrites(self, project_dir):
-        f = await register_flow(
-            str(project_dir / "import-project" / "my_module" / "flow.py") + ":test_flow"
-        )
+    async def test_register_flow_allows_identical_calls(
+        self, flow_path, registered_test_flow
+    ):
+        f = await register_flow(f"{flow_path}:test_flow")
         assert f.name == "test"
 
+    async def test_register_flow_disallows_overwrites(
+        self, flow_path, registered_test_flow
+    ):
         with pytest.raises(ValueError, match="Conflicting entry found"):
-            await register_flow(
-                str(project_dir / "import-project" / "my_module" / "flow.py")
-                + ":prod_flow"
-            )
-
-        f = await register_flow(
-            str(project_dir / "import-project" / "my_module" / "flow.py")
-            + ":prod_flow",
-            force=True,
-        )
+            await register_flow(f"{flow_path}:prod_flow")
+
+    async def test_register_flow_allows_overwrites_with_force(
+        self, flow_path, registered_test_flow
+    ):
+        f = await register_flow(f"{flow_path}:prod_flow", force=True)
         assert f.name == "test"